@@ -12,8 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import OrderedDict
 from enum import Enum
+from functools import lru_cache
 
 from .base import HashableMapping, HashableSequence
 from .warnings import (
@@ -44,9 +44,10 @@ from .warnings import (
 
 class FomodEnum(Enum):
     @classmethod
+    @lru_cache(maxsize=None)
     def default(cls):
         # default becomes the first defined member
-        return list(cls.__members__.values())[0]
+        return next(iter(cls.__members__.values()))
 
 
 class ConditionType(FomodEnum):
@@ -86,7 +87,7 @@ class BaseFomod(object):
     def __init__(self, tag, attrib):
         self._tag = tag
         self._attrib = attrib
-        self._children = OrderedDict()
+        self._children = {}
         self._lineno = None
 
     @property
@@ -94,37 +95,35 @@ class BaseFomod(object):
         return self._lineno
 
     def to_string(self):
-        raise NotImplementedError()
+        lines = []
+        for depth, line in self._write_lines(0):
+            indent = "  " * depth
+            if "\n" in line:
+                line = line.replace("\n", "\n" + indent)
+            lines.append(indent + line)
+        return "\n".join(lines)
 
     def validate(self, **callbacks):
         warnings = []
-        for key, funcs in callbacks.items():
-            if isinstance(self, globals()[key]):
-                for func in funcs:
-                    warnings.extend(func(self))
+        for key in _matching_callbacks(type(self), tuple(callbacks)):
+            for func in callbacks[key]:
+                warnings.extend(func(self))
         return warnings
 
     @staticmethod
     def _write_attributes(attrib):
-        result = ""
-        for attr, value in attrib.items():
-            result += " "
-            result += str(attr)
-            result += "="
-            result += '"{}"'.format(str(value))
-        return result
-
-    def _write_children(self):
-        children = ""
-        for tag, data in self._children.items():
-            attribs = data[0]
-            text = data[1]
-            attribs_str = self._write_attributes(attribs)
-            if text:
-                children += "\n" + "<{0}{2}>{1}</{0}>".format(tag, text, attribs_str)
-            else:
-                children += "\n" + "<{}{}/>".format(tag, attribs_str)
-        return children
+        return "".join(f' {attr!s}="{value!s}"' for attr, value in attrib.items())
+
+    def _write_lines(self, depth):
+        raise NotImplementedError()
+
+    @staticmethod
+    def _write_child(tag, data):
+        attribs, text = data
+        attribs_str = BaseFomod._write_attributes(attribs)
+        if text:
+            return f"<{tag}{attribs_str}>{text}</{tag}>"
+        return f"<{tag}{attribs_str}/>"
 
 
 class Root(BaseFomod):
@@ -255,44 +254,32 @@ class Root(BaseFomod):
 
         return Installer(self, path, game_version, file_type)
 
-    def to_string(self):
-        children = ""
-        head = "<{}{}>".format(self._tag, self._write_attributes(self._attrib))
-        children += "\n" + self._name.to_string()
+    def _write_lines(self, depth):
+        yield depth, f"<{self._tag}{self._write_attributes(self._attrib)}>"
+        yield from self._name._write_lines(depth + 1)
         if self._image._attrib:
-            children += "\n" + self._image.to_string()
+            yield from self._image._write_lines(depth + 1)
         if self._conditions:
-            children += "\n" + self._conditions.to_string()
+            yield from self._conditions._write_lines(depth + 1)
         if self._files:
-            children += "\n" + self._files.to_string()
+            yield from self._files._write_lines(depth + 1)
         if self._pages:
-            children += "\n" + self._pages.to_string()
+            yield from self._pages._write_lines(depth + 1)
         if self._file_patterns:
-            children += "\n" + self._file_patterns.to_string()
-        children = children.replace("\n", "\n  ")
-        tail = "</{}>".format(self._tag)
-        return "{}{}\n{}".format(head, children, tail)
+            yield from self._file_patterns._write_lines(depth + 1)
+        yield depth, f"</{self._tag}>"
 
     def validate(self, **callbacks):
         warnings = super().validate(**callbacks)
-        flag_set = []
+        flag_set = set()
         flag_dep = []
 
-        def parse_conditions(conditions):
-            result = []
-            for key, value in conditions.items():
-                if isinstance(key, Conditions):
-                    result.extend(parse_conditions(key))
-                elif isinstance(key, str) and isinstance(value, str):
-                    result.append((key, conditions))
-            return result
-
         # the lambdas need the 'or []' to comply with returning a list
         callbacks.setdefault("Conditions", []).append(
-            lambda x: flag_dep.extend(parse_conditions(x)) or []
+            lambda x: flag_dep.extend(_walk_conditions(x)) or []
         )
         callbacks.setdefault("Flags", []).append(
-            lambda x: flag_set.extend(x.keys()) or []
+            lambda x: flag_set.update(x.keys()) or []
         )
         warnings.extend(self._info.validate(**callbacks))
         warnings.extend(self._name.validate(**callbacks))
@@ -322,25 +309,34 @@ class Info(BaseFomod):
             attrib = {}
         super().__init__("fomod", attrib)
 
+    def _find_tag(self, tag):
+        # tags are matched case-insensitively, try the exact one first
+        if tag in self._children:
+            return tag
+        tag_lower = tag.lower()
+        for key in self._children:
+            if key.lower() == tag_lower:
+                return key
+        return None
+
     def get_text(self, tag):
-        for key, value in self._children.items():
-            if key.lower() == tag.lower():
-                return value[1]
-        return ""
+        key = self._find_tag(tag)
+        if key is None:
+            return ""
+        return self._children[key][1]
 
     def set_text(self, tag, text):
-        for key, value in self._children.items():
-            if key.lower() == tag.lower():
-                self._children[key] = (value[0], text)
-                return
-        self._children[tag] = ({}, text)
+        key = self._find_tag(tag)
+        if key is None:
+            self._children[tag] = ({}, text)
+        else:
+            self._children[key] = (self._children[key][0], text)
 
-    def to_string(self):
-        head = "<{}{}>".format(self._tag, self._write_attributes(self._attrib))
-        children = self._write_children()
-        children = children.replace("\n", "\n  ")
-        tail = "</{}>".format(self._tag)
-        return "{}{}\n{}".format(head, children, tail)
+    def _write_lines(self, depth):
+        yield depth, f"<{self._tag}{self._write_attributes(self._attrib)}>"
+        for tag, data in self._children.items():
+            yield depth + 1, self._write_child(tag, data)
+        yield depth, f"</{self._tag}>"
 
 
 class Name(BaseFomod):
@@ -350,9 +346,9 @@ class Name(BaseFomod):
         super().__init__("moduleName", attrib)
         self.name = ""
 
-    def to_string(self):
+    def _write_lines(self, depth):
         attrib = self._write_attributes(self._attrib)
-        return "<{0}{1}>{2}</{0}>".format(self._tag, attrib, self.name)
+        yield depth, f"<{self._tag}{attrib}>{self.name}</{self._tag}>"
 
     def validate(self, **callbacks):
         warnings = super().validate(**callbacks)
@@ -367,9 +363,9 @@ class Image(BaseFomod):
             attrib = {}
         super().__init__("moduleImage", attrib)
 
-    def to_string(self):
+    def _write_lines(self, depth):
         attrib = self._write_attributes(self._attrib)
-        return "<{0}{1}/>".format(self._tag, attrib)
+        yield depth, f"<{self._tag}{attrib}/>"
 
 
 class Conditions(BaseFomod, HashableMapping):
@@ -378,7 +374,7 @@ class Conditions(BaseFomod, HashableMapping):
             attrib = {}
         super().__init__("dependencies", attrib)
         self._type = ConditionType.AND
-        self._map = OrderedDict()
+        self._map = {}
 
     @property
     def type(self):
@@ -415,26 +411,24 @@ class Conditions(BaseFomod, HashableMapping):
     def __len__(self):
         return len(self._map)
 
-    def to_string(self):
-        children = ""
+    def _write_lines(self, depth):
         attrib = dict(self._attrib)
         attrib["operator"] = self._type.value
-        head = "<{}{}>".format(self._tag, self._write_attributes(attrib))
+        yield depth, f"<{self._tag}{self._write_attributes(attrib)}>"
         for key, value in self._map.items():
             if key is None and bool(value):
-                child = '<gameDependency version="{}"/>'.format(value)
+                yield depth + 1, f'<gameDependency version="{value}"/>'
             elif isinstance(key, Conditions) and bool(key):
-                child = key.to_string()
+                yield from key._write_lines(depth + 1)
             elif isinstance(value, str):  # string key
                 tag = "flagDependency"
-                child = '<{} flag="{}" value="{}"/>'.format(tag, key, value)
+                child = f'<{tag} flag="{key}" value="{value}"/>'
+                yield depth + 1, child
             elif isinstance(value, FileType) and bool(key):  # string key
                 tag = "fileDependency"
-                child = '<{} file="{}" state="{}"/>'.format(tag, key, value.value)
-            children += "\n" + child
-        children = children.replace("\n", "\n  ")
-        tail = "</{}>".format(self._tag)
-        return "{}{}\n{}".format(head, children, tail)
+                child = f'<{tag} file="{key}" state="{value.value}"/>'
+                yield depth + 1, child
+        yield depth, f"</{self._tag}>"
 
     def validate(self, **callbacks):
         warnings = super().validate(**callbacks)
@@ -460,15 +454,27 @@ class Files(BaseFomod, HashableMapping):
         super().__init__("files", attrib)
         self._file_list = []
 
+    def _find(self, key):
+        # a trailing slash is dropped unless a source with it exists,
+        # both are checked in a single pass over the list
+        stripped = key[:-1] if key.endswith(("/", "\\")) else None
+        fallback = None
+        for index, item in enumerate(self._file_list):
+            if item.src == key:
+                return key, index
+            if fallback is None and item.src == stripped:
+                fallback = index
+        if stripped is None:
+            return key, None
+        return stripped, fallback
+
     def __getitem__(self, key):
         if not isinstance(key, str):
             raise TypeError("Key must be string.")
-        if key.endswith(("/", "\\")) and key not in self:
-            key = key[:-1]
-        try:
-            return next(a.dst for a in self._file_list if a.src == key)
-        except StopIteration:
+        _, index = self._find(key)
+        if index is None:
             raise KeyError()
+        return self._file_list[index].dst
 
     # trailing slash -> folder, else file
     def __setitem__(self, key, value):
@@ -476,57 +482,44 @@ class Files(BaseFomod, HashableMapping):
             raise TypeError("Key must be string.")
         if not isinstance(value, str):
             raise TypeError("Value must be string.")
-        folder = False
-        if key.endswith(("/", "\\")) and key not in self:
-            key = key[:-1]
-            folder = True
-        try:
-            next(a for a in self._file_list if a.src == key).dst = value
-        except StopIteration:
-            if folder:
-                new = File(tag="folder")
-            else:
-                new = File(tag="file")
-            new.src = key
-            new.dst = value
-            self._file_list.append(new)
+        source, index = self._find(key)
+        if index is not None:
+            self._file_list[index].dst = value
+            return
+        if source != key:
+            new = File(tag="folder")
+        else:
+            new = File(tag="file")
+        new.src = source
+        new.dst = value
+        self._file_list.append(new)
 
     def __delitem__(self, key):
         if not isinstance(key, str):
             raise TypeError("Key must be string.")
-        if key.endswith(("/", "\\")) and key not in self:
-            key = key[:-1]
-        try:
-            value = next(a for a in self._file_list if a.src == key)
-            self._file_list.remove(value)
-        except StopIteration:
+        _, index = self._find(key)
+        if index is None:
             raise KeyError()
+        del self._file_list[index]
 
     def __iter__(self):
         for item in self._file_list:
             source = item.src
             if item._tag == "folder" and not source.endswith(("/", "\\")):
-                source = "{}/".format(source)
+                source = f"{source}/"
             yield source
 
     def __len__(self):
         return len(self._file_list)
 
     def __contains__(self, key):
-        try:
-            next(a for a in self._file_list if a.src == key)
-            return True
-        except StopIteration:
-            return False
+        return any(a.src == key for a in self._file_list)
 
-    def to_string(self):
-        children = ""
-        head = "<{}{}>".format(self._tag, self._write_attributes(self._attrib))
+    def _write_lines(self, depth):
+        yield depth, f"<{self._tag}{self._write_attributes(self._attrib)}>"
         for child in self._file_list:
-            children += "\n" + child.to_string()
-        children = children.replace("\n", "\n  ")
-        tail = "</{}>".format(self._tag)
-        return "{}{}\n{}".format(head, children, tail)
+            yield from child._write_lines(depth + 1)
+        yield depth, f"</{self._tag}>"
 
     def validate(self, **callbacks):
         warnings = super().validate(**callbacks)
@@ -543,14 +536,14 @@ class File(BaseFomod):
         self.src = ""
         self.dst = ""
 
-    def to_string(self):
+    def _write_lines(self, depth):
         attrib = dict(self._attrib)
         attrib["source"] = self.src
         if self.dst is not None:
             attrib["destination"] = self.dst
         elif "destination" in attrib:
             del attrib["destination"]
-        return "<{}{}/>".format(self._tag, self._write_attributes(attrib))
+        yield depth, f"<{self._tag}{self._write_attributes(attrib)}/>"
 
     def validate(self, **callbacks):
         warnings = super().validate(**callbacks)
@@ -593,22 +586,30 @@ class Pages(BaseFomod, HashableSequence):
     def __len__(self):
         return len(self._page_list)
 
+    def __iter__(self):
+        return iter(self._page_list)
+
+    def __contains__(self, value):
+        return value in self._page_list
+
+    def index(self, value, start=0, stop=None):
+        if stop is None:
+            stop = len(self._page_list)
+        return self._page_list.index(value, start, stop)
+
     def insert(self, key, value):
         if not isinstance(value, Page):
             raise ValueError("Value should be Page.")
         self._page_list.insert(key, value)
 
-    def to_string(self):
-        children = ""
+    def _write_lines(self, depth):
         attrib = dict(self._attrib)
         attrib["order"] = self._order.value
-        head = "<{}{}>".format(self._tag, self._write_attributes(attrib))
+        yield depth, f"<{self._tag}{self._write_attributes(attrib)}>"
         for child in self._page_list:
             if child:
-                children += "\n" + child.to_string()
-        children = children.replace("\n", "\n  ")
-        tail = "</{}>".format(self._tag)
-        return "{}{}\n{}".format(head, children, tail)
+                yield from child._write_lines(depth + 1)
+        yield depth, f"</{self._tag}>"
 
     def validate(self, **callbacks):
         warnings = super().validate(**callbacks)
@@ -675,30 +676,37 @@ class Page(BaseFomod, HashableSequence):
     def __len__(self):
         return len(self._group_list)
 
+    def __iter__(self):
+        return iter(self._group_list)
+
+    def __contains__(self, value):
+        return value in self._group_list
+
+    def index(self, value, start=0, stop=None):
+        if stop is None:
+            stop = len(self._group_list)
+        return self._group_list.index(value, start, stop)
+
     def insert(self, key, value):
         if not isinstance(value, Group):
             raise ValueError("Value should be Group.")
         self._group_list.insert(key, value)
 
-    def to_string(self):
-        children = ""
+    def _write_lines(self, depth):
         grp_tag = "optionalFileGroups"
         attrib = dict(self._attrib)
         attrib["name"] = self._name
         grp_attrib = {"order": self._order.value}
-        head = "<{}{}>".format(self._tag, self._write_attributes(attrib))
-        grp_head = "<{}{}>".format(grp_tag, self._write_attributes(grp_attrib))
-        grp_tail = "</{}>".format(grp_tag)
-        tail = "</{}>".format(self._tag)
+        yield depth, f"<{self._tag}{self._write_attributes(attrib)}>"
         if self._conditions:
-            children += "\n" + self._conditions.to_string()
-        children += "\n" + grp_head
+            yield from self._conditions._write_lines(depth + 1)
+        grp_head = f"<{grp_tag}{self._write_attributes(grp_attrib)}>"
+        yield depth + 1, grp_head
         for child in self._group_list:
             if child:
-                children += "\n  " + child.to_string().replace("\n", "\n  ")
-        children += "\n" + grp_tail
-        children = children.replace("\n", "\n  ")
-        return "{}{}\n{}".format(head, children, tail)
+                yield from child._write_lines(depth + 2)
+        yield depth + 1, f"</{grp_tag}>"
+        yield depth, f"</{self._tag}>"
 
     def validate(self, **callbacks):
         warnings = super().validate(**callbacks)
@@ -769,28 +777,35 @@ class Group(BaseFomod, HashableSequence):
     def __len__(self):
         return len(self._option_list)
 
+    def __iter__(self):
+        return iter(self._option_list)
+
+    def __contains__(self, value):
+        return value in self._option_list
+
+    def index(self, value, start=0, stop=None):
+        if stop is None:
+            stop = len(self._option_list)
+        return self._option_list.index(value, start, stop)
+
     def insert(self, key, value):
         if not isinstance(value, Option):
             raise ValueError("Value should be Option.")
         self._option_list.insert(key, value)
 
-    def to_string(self):
-        children = ""
+    def _write_lines(self, depth):
         opt_tag = "plugins"
         attrib = dict(self._attrib)
         attrib["name"] = self._name
         attrib["type"] = self._type.value
         opt_attrib = {"order": self._order.value}
-        head = "<{}{}>".format(self._tag, self._write_attributes(attrib))
-        opt_head = "<{}{}>".format(opt_tag, self._write_attributes(opt_attrib))
-        opt_tail = "</{}>".format(opt_tag)
-        tail = "</{}>".format(self._tag)
-        children += "\n" + opt_head
+        yield depth, f"<{self._tag}{self._write_attributes(attrib)}>"
+        opt_head = f"<{opt_tag}{self._write_attributes(opt_attrib)}>"
+        yield depth + 1, opt_head
         for child in self._option_list:
-            children += "\n  " + child.to_string().replace("\n", "\n  ")
-        children += "\n" + opt_tail
-        children = children.replace("\n", "\n  ")
-        return "{}{}\n{}".format(head, children, tail)
+            yield from child._write_lines(depth + 2)
+        yield depth + 1, f"</{opt_tag}>"
+        yield depth, f"</{self._tag}>"
 
     def validate(self, **callbacks):
         warnings = super().validate(**callbacks)
@@ -807,15 +822,18 @@ class Group(BaseFomod, HashableSequence):
 
         for option in self._option_list:
             warnings.extend(option.validate(**callbacks))
-            if isinstance(option.type, OptionType):
-                if option.type is OptionType.REQUIRED:
+            option_type = option.type
+            if isinstance(option_type, OptionType):
+                if option_type is OptionType.REQUIRED:
                     required_options += 1
-                elif option.type is OptionType.NOTUSABLE:
+                elif option_type is OptionType.NOTUSABLE:
                     notusable_options += 1
             else:
-                if OptionType.REQUIRED in option.type.values():
+                # the raw dict view skips the Mapping mixin's per-key __getitem__
+                type_values = option_type._map.values()
+                if OptionType.REQUIRED in type_values:
                     required_options += 1
-                elif OptionType.NOTUSABLE in option.type.values():
+                elif OptionType.NOTUSABLE in type_values:
                     notusable_options += 1
 
         if notusable_options == option_num:
@@ -905,28 +923,24 @@ class Option(BaseFomod):
             raise ValueError("Value should be OptionType or Type.")
         self._type = value
 
-    def to_string(self):
-        children = ""
+    def _write_lines(self, depth):
         attrib = dict(self._attrib)
         attrib["name"] = self.name
-        head = "<{}{}>".format(self._tag, self._write_attributes(attrib))
-        children += "\n"
-        children += "<description>{}</description>".format(self.description)
+        yield depth, f"<{self._tag}{self._write_attributes(attrib)}>"
+        yield depth + 1, f"<description>{self.description}</description>"
         if self.image:
-            children += "\n" + '<image path="{}"/>'.format(self.image)
+            yield depth + 1, f'<image path="{self.image}"/>'
         if self.files:
-            children += "\n" + self.files.to_string()
+            yield from self.files._write_lines(depth + 1)
         if self.flags:
-            children += "\n" + self.flags.to_string()
-        children += "\n" + "<typeDescriptor>"
+            yield from self.flags._write_lines(depth + 1)
+        yield depth + 1, "<typeDescriptor>"
         if isinstance(self.type, OptionType):
-            children += "\n  " + '<type name="{}"/>'.format(self.type.value)
+            yield depth + 2, f'<type name="{self.type.value}"/>'
         else:
-            children += "\n  " + self.type.to_string()
-        children += "\n" + "</typeDescriptor>"
-        children = children.replace("\n", "\n  ")
-        tail = "</{}>".format(self._tag)
-        return "{}{}\n{}".format(head, children, tail)
+            yield from self.type._write_lines(depth + 2)
+        yield depth + 1, "</typeDescriptor>"
+        yield depth, f"</{self._tag}>"
 
     def validate(self, **callbacks):
         warnings = super().validate(**callbacks)
@@ -950,7 +964,7 @@ class Flags(BaseFomod, HashableMapping):
         if attrib is None:
             attrib = {}
         super().__init__("conditionFlags", attrib)
-        self._map = OrderedDict()
+        self._map = {}
 
     def __getitem__(self, key):
         return self._map[key]
@@ -971,14 +985,11 @@ class Flags(BaseFomod, HashableMapping):
     def __len__(self):
         return len(self._map)
 
-    def to_string(self):
-        children = ""
-        head = "<{}{}>".format(self._tag, self._write_attributes(self._attrib))
+    def _write_lines(self, depth):
+        yield depth, f"<{self._tag}{self._write_attributes(self._attrib)}>"
         for key, value in self._map.items():
-            children += "\n" + '<flag name="{}">{}</flag>'.format(key, value)
-        children = children.replace("\n", "\n  ")
-        tail = "</{}>".format(self._tag)
-        return "{}{}\n{}".format(head, children, tail)
+            yield depth + 1, f'<flag name="{key}">{value}</flag>'
+        yield depth, f"</{self._tag}>"
 
 
 class Type(BaseFomod, HashableMapping):
@@ -987,7 +998,7 @@ class Type(BaseFomod, HashableMapping):
             attrib = {}
         super().__init__("dependencyType", attrib)
         self._default = OptionType.OPTIONAL
-        self._map = OrderedDict()
+        self._map = {}
 
     @property
     def default(self):
@@ -1019,21 +1030,17 @@ class Type(BaseFomod, HashableMapping):
     def __len__(self):
         return len(self._map)
 
-    def to_string(self):
-        children = ""
-        head = "<{}{}>".format(self._tag, self._write_attributes(self._attrib))
-        children += "\n"
-        children += '<defaultType name="{}"/>'.format(self.default.value)
-        children += "\n" + "<patterns>"
+    def _write_lines(self, depth):
+        yield depth, f"<{self._tag}{self._write_attributes(self._attrib)}>"
+        yield depth + 1, f'<defaultType name="{self.default.value}"/>'
+        yield depth + 1, "<patterns>"
         for key, value in self._map.items():
-            children += "\n  " + "<pattern>"
-            children += "\n    " + key.to_string().replace("\n", "\n    ")
-            children += "\n    " + '<type name="{}"/>'.format(value.value)
-            children += "\n  " + "</pattern>"
-        children += "\n" + "</patterns>"
-        children = children.replace("\n", "\n  ")
-        tail = "</{}>".format(self._tag)
-        return "{}{}\n{}".format(head, children, tail)
+            yield depth + 2, "<pattern>"
+            yield from key._write_lines(depth + 3)
+            yield depth + 3, f'<type name="{value.value}"/>'
+            yield depth + 2, "</pattern>"
+        yield depth + 1, "</patterns>"
+        yield depth, f"</{self._tag}>"
 
     def validate(self, **callbacks):
         warnings = super().validate(**callbacks)
@@ -1049,7 +1056,7 @@ class FilePatterns(BaseFomod, HashableMapping):
         if attrib is None:
             attrib = {}
         super().__init__("conditionalFileInstalls", attrib)
-        self._map = OrderedDict()
+        self._map = {}
 
     def __getitem__(self, key):
         return self._map[key]
@@ -1072,19 +1079,16 @@ class FilePatterns(BaseFomod, HashableMapping):
     def __len__(self):
         return len(self._map)
 
-    def to_string(self):
-        children = ""
-        head = "<{}{}>".format(self._tag, self._write_attributes(self._attrib))
-        children += "\n" + "<patterns>"
+    def _write_lines(self, depth):
+        yield depth, f"<{self._tag}{self._write_attributes(self._attrib)}>"
+        yield depth + 1, "<patterns>"
         for key, value in self._map.items():
-            children += "\n  " + "<pattern>"
-            children += "\n    " + key.to_string().replace("\n", "\n    ")
-            children += "\n    " + value.to_string().replace("\n", "\n    ")
-            children += "\n  " + "</pattern>"
-        children += "\n" + "</patterns>"
-        children = children.replace("\n", "\n  ")
-        tail = "</{}>".format(self._tag)
-        return "{}{}\n{}".format(head, children, tail)
+            yield depth + 2, "<pattern>"
+            yield from key._write_lines(depth + 3)
+            yield from value._write_lines(depth + 3)
+            yield depth + 2, "</pattern>"
+        yield depth + 1, "</patterns>"
+        yield depth, f"</{self._tag}>"
 
     def validate(self, **callbacks):
         warnings = super().validate(**callbacks)
@@ -1092,3 +1096,30 @@ class FilePatterns(BaseFomod, HashableMapping):
             warnings.extend(key.validate(**callbacks))
             warnings.extend(value.validate(**callbacks))
         return warnings
+
+
+def _walk_conditions(conditions):
+    # yields (flag, parent conditions) depth-first, in the order they're written
+    stack = [(conditions, iter(conditions.items()))]
+    while stack:
+        current, items = stack[-1]
+        for key, value in items:
+            if isinstance(key, Conditions):
+                stack.append((key, iter(key.items())))
+                break
+            if isinstance(key, str) and isinstance(value, str):
+                yield key, current
+        else:
+            stack.pop()
+
+
+# validate() callbacks are keyed by class name, resolve them without globals()
+_CALLBACK_CLASSES = {
+    name: value for name, value in globals().items() if isinstance(value, type)
+}
+
+
+@lru_cache(maxsize=None)
+def _matching_callbacks(cls, keys):
+    # keys stay a tuple so callbacks keep running in the order they were given
+    return tuple(key for key in keys if issubclass(cls, _CALLBACK_CLASSES[key]))
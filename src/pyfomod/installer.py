@@ -34,6 +34,22 @@ class InvalidSelection(Exception):
     pass
 
 
+_UNSET = object()
+
+
+def _cached_call(func):
+    # returns a callable that only calls func the first time it is used
+    result = _UNSET
+
+    def wrapper():
+        nonlocal result
+        if result is _UNSET:
+            result = func()
+        return result
+
+    return wrapper
+
+
 class InstallerOption(object):
     def __init__(self, installer, option):
         self._installer = installer
@@ -89,6 +105,8 @@ class InstallerPage(Sequence):
 
 
 class FileInfo(object):
+    __slots__ = ("source", "destination", "priority")
+
     def __init__(self, source, destination, priority):
         self.source = source
         self.destination = destination
@@ -117,25 +135,21 @@ class FileInfo(object):
                 # destination still needs normalizing
                 destination = str(Path(destination))
             priority = int(file_object._attrib.get("priority", "0"))
-            if (
-                path is None
-                or not (path / source).exists()
-                or (path / source).is_file()
-            ):
+            if path is None or not (path / source).is_dir():
                 result.append(cls(source, destination, priority))
                 continue
             source_path = path / source
             for dirpath, dirnames, fnames in os.walk(source_path):
+                # resolve the folder once, files only need their name appended
+                rel_dir = Path(dirpath).relative_to(source_path)
+                src_dir = Path(source, rel_dir)
+                dst_dir = Path(destination, rel_dir)
                 if not dirnames and not fnames:
-                    src = str(Path(dirpath).relative_to(path))
-                    dst = str(Path(destination, Path(dirpath).relative_to(source_path)))
-                    result.append(cls(src, dst, priority))
+                    result.append(cls(str(src_dir), str(dst_dir), priority))
                     continue
                 for fname in fnames:
-                    src = str(Path(dirpath, fname).relative_to(path))
-                    dst = str(
-                        Path(destination, Path(dirpath, fname).relative_to(source_path))
-                    )
+                    src = str(src_dir / fname)
+                    dst = str(dst_dir / fname)
                     result.append(cls(src, dst, priority))
         return result
 
@@ -173,6 +187,7 @@ class Installer(object):
             selected_options = []
         # get the real options
         real_options = [option._object for option in selected_options]
+        selected_set = set(real_options)
         # validate options
         for group in self._current_page:
             # validate group type
@@ -206,21 +221,28 @@ class Installer(object):
                 inst_option = InstallerOption(self, option)  # resolves option type
                 if (
                     inst_option.type is fomod.OptionType.REQUIRED
-                    and option not in real_options
+                    and option not in selected_set
                 ):
                     raise InvalidSelection(
                         f"Option {option.name} is required but was not selected."
                     )
                 elif (
                     inst_option.type is fomod.OptionType.NOTUSABLE
-                    and option in real_options
+                    and option in selected_set
                 ):
                     raise InvalidSelection(
                         f"Option {option.name} is not usable but was selected."
                     )
         # sort options
-        sorted_list = [option for group in self._current_page for option in group]
-        real_options = sorted(real_options, key=sorted_list.index)
+        sorted_index = {}
+        for group in self._current_page:
+            for option in group:
+                sorted_index.setdefault(option, len(sorted_index))
+        for option in real_options:
+            if option not in sorted_index:
+                # same error list.index raised for options not on this page
+                raise ValueError(f"{option!r} is not in list")
+        real_options = sorted(real_options, key=sorted_index.__getitem__)
         self._previous_pages[self._current_page] = real_options
         # order pages
         ordered_pages = self._order_list(self.root.pages, self.root.pages.order)
@@ -297,8 +319,10 @@ class Installer(object):
                 f"but is {actual_type.value} intead."
             )
 
-    def _test_flag_condition(self, flag_name, flag_value):
-        actual_value = self.flags().get(flag_name, None)
+    def _test_flag_condition(self, flag_name, flag_value, flags=None):
+        if flags is None:
+            flags = self.flags()
+        actual_value = flags.get(flag_name, None)
         if actual_value != flag_value:
             raise _FailedCondition(
                 f"Flag {flag_name} was expected to have "
@@ -317,12 +341,15 @@ class Installer(object):
 
     @staticmethod
     def _raise_failed_conditions(failed):
-        msg = "The following condition(s) have failed:"
-        for cond in failed:
-            msg += "\n\t" + cond
+        msg = "\n\t".join(["The following condition(s) have failed:"] + failed)
         raise FailedCondition(msg)
 
-    def _test_conditions(self, conditions):
+    def _test_conditions(self, conditions, flag_cache=None):
+        # flag_cache lazily builds the self.flags() result - flags can't change
+        # while testing, so it's built at the first flag dependency only and
+        # shared with the nested conditions
+        if flag_cache is None:
+            flag_cache = _cached_call(self.flags)
         op = conditions.type
         failed = []
         for key, value in conditions.items():
@@ -333,9 +360,9 @@ class Installer(object):
                     if isinstance(value, fomod.FileType):
                         self._test_file_condition(key, value)
                     if isinstance(value, str):
-                        self._test_flag_condition(key, value)
+                        self._test_flag_condition(key, value, flag_cache())
                 elif isinstance(key, fomod.Conditions):
-                    self._test_conditions(key)
+                    self._test_conditions(key, flag_cache)
             except (FailedCondition, _FailedCondition) as exc:
                 if isinstance(exc, FailedCondition):
                     msgs = [a.strip() for a in str(exc).splitlines()[1:]]
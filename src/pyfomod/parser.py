@@ -14,7 +14,7 @@
 
 import errno
 import os
-from collections import OrderedDict
+import threading
 from contextlib import suppress
 from pathlib import Path
 
@@ -53,11 +53,24 @@ from .warnings import (
 SCHEMA_PATH = Path(__file__).parent / "fomod.xsd"
 
 
+_SCHEMA_CACHE = threading.local()
+
+
+def _get_schema():
+    # compiling the schema is expensive and it never changes, but every
+    # validate() rewrites its error_log so each thread needs its own copy
+    try:
+        return _SCHEMA_CACHE.schema
+    except AttributeError:
+        _SCHEMA_CACHE.schema = etree.XMLSchema(etree.parse(str(SCHEMA_PATH)))
+        return _SCHEMA_CACHE.schema
+
+
 class Placeholder(object):
     def __init__(self, tag, attrib):
         self._tag = tag
         self._attrib = attrib
-        self._children = OrderedDict()
+        self._children = {}
 
 
 class PatternPlaceholder(Placeholder):
@@ -98,10 +111,8 @@ class Target(object):
 
     def start(self, tag, attrib):
         attrib = dict(attrib)
-        with suppress(IndexError):
-            parent = self._stack[-1]
-        with suppress(IndexError):
-            gparent = self._stack[-2]
+        parent = self._stack[-1] if self._stack else None
+        gparent = self._stack[-2] if len(self._stack) > 1 else None
         if tag == "config":
             elem = Root(attrib)
         elif tag == "fomod":
@@ -178,10 +189,8 @@ class Target(object):
     def end(self, tag):
         elem = self._stack.pop()
         assert tag == elem._tag
-        with suppress(IndexError):
-            parent = self._stack[-1]
-        with suppress(IndexError):
-            gparent = self._stack[-2]
+        parent = self._stack[-1] if self._stack else None
+        gparent = self._stack[-2] if len(self._stack) > 1 else None
 
         data = "".join(self._data).strip()
         del self._data[:]
@@ -242,19 +251,54 @@ class Target(object):
         return self._last
 
 
-def _iterparse(file_path, target):
-    events = ("start", "end")
-    for event, element in etree.iterparse(file_path, events=events):
+def _feed_target(events, target, lineno):
+    # iterparse may not have read an element's text by its "start" event, nor
+    # its tail by its "end" event - both are only complete once the next event
+    # arrives, so they are fed to the target then
+    pending = None
+    pending_tail = False
+    for event, element in events:
+        if pending is not None:
+            text = pending.tail if pending_tail else pending.text
+            if text is not None:
+                target.data(text)
         if event == "start":
             new_elem = target.start(element.tag, element.attrib)
-            new_elem._lineno = element.sourceline
-            if element.text is not None:
-                target.data(element.text)
+            if lineno:
+                new_elem._lineno = element.sourceline
         elif event == "end":
             target.end(element.tag)
+        elif event == "comment":
+            target.comment(element.text)
+        # processing instructions are skipped, only their tail is kept
+        pending = element
+        pending_tail = event != "start"
     return target.close()
 
 
+def _iterparse(file_path, target):
+    def events():
+        events = ("start", "end", "comment", "pi")
+        for event, element in etree.iterparse(file_path, events=events):
+            yield event, element
+            if event == "end":
+                # the target is done with this element - free it and any
+                # preceding siblings so the whole tree is never kept in memory,
+                # the tail is kept since it is only fed on the next event
+                element.clear(keep_tail=True)
+                parent = element.getparent()
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
+
+    return _feed_target(events(), target, lineno=True)
+
+
+def _iterwalk(tree, target, lineno):
+    events = etree.iterwalk(tree, events=("start", "end", "comment", "pi"))
+    return _feed_target(events, target, lineno)
+
+
 def parse(source, warnings=None, lineno=False):
     if isinstance(source, (tuple, list)):
         info, conf = source
@@ -274,22 +318,28 @@ def parse(source, warnings=None, lineno=False):
             )
         else:
             conf = str(conf)
+    parser_target = Target(warnings)
     if warnings is not None:
-        schema = etree.XMLSchema(etree.parse(str(SCHEMA_PATH)))
+        # the config is parsed only once - the same tree is
+        # validated against the schema and then fed to the target
         try:
-            etree.parse(conf, etree.XMLParser(schema=schema))
+            conf_tree = etree.parse(conf)
         except etree.XMLSyntaxError as exc:
             warnings.append(InvalidSyntaxWarning(str(exc)))
-    parser_target = Target(warnings)
-    if lineno:
+            raise
+        schema = _get_schema()
+        if not schema.validate(conf_tree):
+            warnings.append(InvalidSyntaxWarning(schema.error_log[0].message))
+        root = _iterwalk(conf_tree, parser_target, lineno)
+    elif lineno:
         root = _iterparse(conf, parser_target)
-        if info is not None:
-            root._info = _iterparse(conf, parser_target)
     else:
-        parser = etree.XMLParser(target=Target(warnings))
-        root = etree.parse(conf, parser)
-        if info is not None:
-            root._info = etree.parse(info, parser)
+        root = etree.parse(conf, etree.XMLParser(target=parser_target))
+    if info is not None:
+        if lineno:
+            root._info = _iterparse(info, parser_target)
+        else:
+            root._info = etree.parse(info, etree.XMLParser(target=parser_target))
     if info is None and warnings is not None:
         warnings.append(MissingInfoWarning())
     return root
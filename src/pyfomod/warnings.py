@@ -13,9 +13,31 @@
 # limitations under the License.
 
 import re
+from functools import lru_cache
+
+CAMEL_CASE_REGEX = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?=[A-Z]|$)")
+SYNTAX_ERROR_SUFFIX = " (<string>, line 0)"
+
+
+@lru_cache(maxsize=None)
+def _split_camel_case(name):
+    return " ".join(CAMEL_CASE_REGEX.findall(name))
+
+
+@lru_cache(maxsize=None)
+def _attribute_title(attribute):
+    return attribute.title()
+
+
+@lru_cache(maxsize=None)
+def _enum_values(enum_):
+    # enum members are fixed, no need to rebuild these for every warning
+    return "', '".join(x.value for x in enum_), enum_.default().value
 
 
 class ValidationWarning(object):
+    __slots__ = ("title", "msg", "elem", "critical")
+
     def __init__(self, title, msg, elem, critical=False):
         self.title = title
         self.msg = msg
@@ -24,11 +46,11 @@ class ValidationWarning(object):
 
     def __eq__(self, other):
         if isinstance(other, ValidationWarning):
-            return (
-                self.title == other.title
-                and self.msg == other.msg
-                and self.elem == other.elem
-                and self.critical == other.critical
+            return (self.title, self.msg, self.elem, self.critical) == (
+                other.title,
+                other.msg,
+                other.elem,
+                other.critical,
             )
         return NotImplemented
 
@@ -40,14 +62,28 @@ class ValidationWarning(object):
         )
 
 
+class _ConstantWarning(ValidationWarning):
+    # for warnings whose title and message never change
+    __slots__ = ()
+
+    _title = ""
+    _msg = ""
+    _critical = False
+
+    def __init__(self, elem=None):
+        self.title = self._title
+        self.msg = self._msg
+        self.elem = elem
+        self.critical = self._critical
+
+
 class InvalidEnumWarning(ValidationWarning):
+    __slots__ = ()
+
     def __init__(self, tag, enum_, actual, elem):
         # split camel case enum names into title
-        enum_name = " ".join(
-            re.findall(r"[A-Z]?[a-z]+|[A-Z]+(?=[A-Z]|$)", enum_.__name__)
-        )
-        enum_values = "', '".join(x.value for x in enum_)
-        enum_default = enum_.default().value
+        enum_name = _split_camel_case(enum_.__name__)
+        enum_values, enum_default = _enum_values(enum_)
         title = f"Invalid {enum_name}"
         msg = (
             f"{enum_name} was set to '{actual}' in "
@@ -59,8 +95,10 @@ class InvalidEnumWarning(ValidationWarning):
 
 
 class DefaultAttributeWarning(ValidationWarning):
+    __slots__ = ()
+
     def __init__(self, tag, attribute, default, elem):
-        title = f"Missing {attribute.title()} Attribute"
+        title = f"Missing {_attribute_title(attribute)} Attribute"
         msg = (
             f"The '{attribute}' attribute on the '{tag}' "
             f"tag is required. It was set to '{default}'."
@@ -69,8 +107,10 @@ class DefaultAttributeWarning(ValidationWarning):
 
 
 class RequiredAttributeWarning(ValidationWarning):
+    __slots__ = ()
+
     def __init__(self, tag, attribute):
-        title = f"Missing {attribute.title()} Attribute"
+        title = f"Missing {_attribute_title(attribute)} Attribute"
         msg = (
             f"The '{attribute}' attribute on the '{tag}' "
             f"tag is required. This tag will be skipped."
@@ -78,94 +118,113 @@ class RequiredAttributeWarning(ValidationWarning):
         super().__init__(title, msg, None, critical=True)
 
 
-class CommentsPresentWarning(ValidationWarning):
-    def __init__(self):
-        title = "XML Comments Present"
-        msg = "There are comments in the fomod, they will be ignored."
-        super().__init__(title, msg, None, critical=True)
+class CommentsPresentWarning(_ConstantWarning):
+    __slots__ = ()
+
+    _title = "XML Comments Present"
+    _msg = "There are comments in the fomod, they will be ignored."
+    _critical = True
 
 
 class InvalidSyntaxWarning(ValidationWarning):
+    __slots__ = ()
+
     def __init__(self, error_msg):
         title = "XML Syntax Error"
-        msg = error_msg.replace(" (<string>, line 0)", "")
+        msg = error_msg
+        if msg.endswith(SYNTAX_ERROR_SUFFIX):
+            msg = msg[: -len(SYNTAX_ERROR_SUFFIX)]
         super().__init__(title, msg, None, critical=True)
 
 
-class MissingInfoWarning(ValidationWarning):
-    def __init__(self):
-        title = "Missing Info XML"
-        msg = "Info.xml is missing from the fomod subfolder."
-        super().__init__(title, msg, None, critical=False)
+class MissingInfoWarning(_ConstantWarning):
+    __slots__ = ()
 
+    _title = "Missing Info XML"
+    _msg = "Info.xml is missing from the fomod subfolder."
+    _critical = False
 
-class EmptyTreeWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Empty Fomod Tree"
-        msg = "This fomod is empty, nothing will be installed."
-        super().__init__(title, msg, elem, critical=False)
+
+class EmptyTreeWarning(_ConstantWarning):
+    __slots__ = ()
+
+    _title = "Empty Fomod Tree"
+    _msg = "This fomod is empty, nothing will be installed."
+    _critical = False
 
 
 class ImpossibleFlagWarning(ValidationWarning):
+    __slots__ = ()
+
     def __init__(self, flag_name, elem):
         title = "Impossible Flag"
         msg = f"The flag '{flag_name}' is never created or set."
         super().__init__(title, msg, elem, critical=True)
 
 
-class InstallerNameWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Missing Installer Name"
-        msg = "This fomod does not have a name."
-        super().__init__(title, msg, elem, critical=False)
+class InstallerNameWarning(_ConstantWarning):
+    __slots__ = ()
 
+    _title = "Missing Installer Name"
+    _msg = "This fomod does not have a name."
+    _critical = False
 
-class EmptyConditionsWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Empty Conditions"
-        msg = "This element should have at least one condition present."
-        super().__init__(title, msg, elem, critical=False)
 
+class EmptyConditionsWarning(_ConstantWarning):
+    __slots__ = ()
 
-class VersionDependencyWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Empty Version Dependency"
-        msg = "This version dependency is empty."
-        super().__init__(title, msg, elem, critical=False)
+    _title = "Empty Conditions"
+    _msg = "This element should have at least one condition present."
+    _critical = False
 
 
-class FileDependencyWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Empty File Dependency"
-        msg = "This file dependency depends on no file, may not work correctly."
-        super().__init__(title, msg, elem, critical=False)
+class VersionDependencyWarning(_ConstantWarning):
+    __slots__ = ()
+
+    _title = "Empty Version Dependency"
+    _msg = "This version dependency is empty."
+    _critical = False
+
+
+class FileDependencyWarning(_ConstantWarning):
+    __slots__ = ()
+
+    _title = "Empty File Dependency"
+    _msg = "This file dependency depends on no file, may not work correctly."
+    _critical = False
 
 
 class UselessFlagsWarning(ValidationWarning):
+    __slots__ = ()
+
     def __init__(self, flag_name, elem):
         title = "Impossible Flag"
         msg = f"Flag {flag_name} shouldn't be used here since it can't have been set."
         super().__init__(title, msg, elem, critical=True)
 
 
-class EmptySourceWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Empty Source Field"
-        msg = "No source specified, this could lead to problems installing."
-        super().__init__(title, msg, elem, critical=True)
+class EmptySourceWarning(_ConstantWarning):
+    __slots__ = ()
 
+    _title = "Empty Source Field"
+    _msg = "No source specified, this could lead to problems installing."
+    _critical = True
 
-class MissingDestinationWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Missing Destination Field"
-        msg = (
-            "If omitted, the destination is the same as "
-            "the source. This may not be intended."
-        )
-        super().__init__(title, msg, elem, critical=False)
+
+class MissingDestinationWarning(_ConstantWarning):
+    __slots__ = ()
+
+    _title = "Missing Destination Field"
+    _msg = (
+        "If omitted, the destination is the same as "
+        "the source. This may not be intended."
+    )
+    _critical = False
 
 
 class OrderWarning(ValidationWarning):
+    __slots__ = ()
+
     def __init__(self, order, elem):
         title = "Non Explicit Order"
         msg = (
@@ -176,91 +235,103 @@ class OrderWarning(ValidationWarning):
         super().__init__(title, msg, elem, critical=False)
 
 
-class EmptyPageWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Empty Page"
-        msg = "This page is empty."
-        super().__init__(title, msg, elem, critical=False)
+class EmptyPageWarning(_ConstantWarning):
+    __slots__ = ()
 
+    _title = "Empty Page"
+    _msg = "This page is empty."
+    _critical = False
 
-class PageNameWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Empty Page Name"
-        msg = "This page has no name."
-        super().__init__(title, msg, elem, critical=False)
 
+class PageNameWarning(_ConstantWarning):
+    __slots__ = ()
 
-class EmptyGroupWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Empty Group"
-        msg = "This group is empty."
-        super().__init__(title, msg, elem, critical=False)
+    _title = "Empty Page Name"
+    _msg = "This page has no name."
+    _critical = False
 
 
-class GroupNameWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Empty Group Name"
-        msg = "This group has no name."
-        super().__init__(title, msg, elem, critical=False)
+class EmptyGroupWarning(_ConstantWarning):
+    __slots__ = ()
 
+    _title = "Empty Group"
+    _msg = "This group is empty."
+    _critical = False
 
-class AtLeastOneWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Not Enough Selectable Options"
-        msg = "This group needs at least one selectable option but none are available."
-        super().__init__(title, msg, elem, critical=True)
 
+class GroupNameWarning(_ConstantWarning):
+    __slots__ = ()
 
-class ExactlyOneMissingWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Not Enough Selectable Options"
-        msg = "This group needs exactly one selectable option but none are available."
-        super().__init__(title, msg, elem, critical=True)
+    _title = "Empty Group Name"
+    _msg = "This group has no name."
+    _critical = False
 
 
-class ExactlyOneRequiredWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Too Many Required Options"
-        msg = (
-            "This group can only have exactly one option "
-            "selected but at least two are required."
-        )
-        super().__init__(title, msg, elem, critical=True)
+class AtLeastOneWarning(_ConstantWarning):
+    __slots__ = ()
 
+    _title = "Not Enough Selectable Options"
+    _msg = "This group needs at least one selectable option but none are available."
+    _critical = True
 
-class AtMostOneWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Too Many Required Options"
-        msg = (
-            "This group can have one option selected "
-            "at most but at least two are required."
-        )
-        super().__init__(title, msg, elem, critical=True)
 
+class ExactlyOneMissingWarning(_ConstantWarning):
+    __slots__ = ()
 
-class OptionNameWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Empty Option Name"
-        msg = "This option has no name."
-        super().__init__(title, msg, elem, critical=False)
+    _title = "Not Enough Selectable Options"
+    _msg = "This group needs exactly one selectable option but none are available."
+    _critical = True
 
 
-class OptionDescriptionWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Empty Option Description"
-        msg = "This option has no description."
-        super().__init__(title, msg, elem, critical=False)
+class ExactlyOneRequiredWarning(_ConstantWarning):
+    __slots__ = ()
 
+    _title = "Too Many Required Options"
+    _msg = (
+        "This group can only have exactly one option "
+        "selected but at least two are required."
+    )
+    _critical = True
 
-class EmptyOptionWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Option Does Nothing"
-        msg = "This option installs no files and sets no flags."
-        super().__init__(title, msg, elem, critical=False)
 
+class AtMostOneWarning(_ConstantWarning):
+    __slots__ = ()
 
-class EmptyTypeWarning(ValidationWarning):
-    def __init__(self, elem):
-        title = "Empty Type Descriptor"
-        msg = "This type descriptor is empty and will never set a type."
-        super().__init__(title, msg, elem, critical=True)
+    _title = "Too Many Required Options"
+    _msg = (
+        "This group can have one option selected "
+        "at most but at least two are required."
+    )
+    _critical = True
+
+
+class OptionNameWarning(_ConstantWarning):
+    __slots__ = ()
+
+    _title = "Empty Option Name"
+    _msg = "This option has no name."
+    _critical = False
+
+
+class OptionDescriptionWarning(_ConstantWarning):
+    __slots__ = ()
+
+    _title = "Empty Option Description"
+    _msg = "This option has no description."
+    _critical = False
+
+
+class EmptyOptionWarning(_ConstantWarning):
+    __slots__ = ()
+
+    _title = "Option Does Nothing"
+    _msg = "This option installs no files and sets no flags."
+    _critical = False
+
+
+class EmptyTypeWarning(_ConstantWarning):
+    __slots__ = ()
+
+    _title = "Empty Type Descriptor"
+    _msg = "This type descriptor is empty and will never set a type."
+    _critical = True
@@ -1,5 +1,4 @@
 import textwrap
-from collections import OrderedDict
 
 from pyfomod import fomod, warnings
 
@@ -10,14 +9,12 @@ class TestBaseFomod:
         expected = ' boop="beep" value="1"'
         assert fomod.BaseFomod._write_attributes(attrib) == expected
 
-    def test_write_children(self):
-        children = OrderedDict(
-            [("first", ({}, "text")), ("second", ({"beep": "boop"}, ""))]
-        )
-        expected = '\n<first>text</first>\n<second beep="boop"/>'
-        test = fomod.BaseFomod("", {})
-        test._children = children
-        assert test._write_children() == expected
+    def test_write_child(self):
+        expected = "<first>text</first>"
+        assert fomod.BaseFomod._write_child("first", ({}, "text")) == expected
+        expected = '<second beep="boop"/>'
+        test = fomod.BaseFomod._write_child("second", ({"beep": "boop"}, ""))
+        assert test == expected
 
 
 class TestRoot:
@@ -557,6 +554,26 @@ class TestOption:
         )
         assert self.option.to_string() == expected
 
+    def test_to_string_dependency_type(self):
+        self.option.name = "boo"
+        type_ = fomod.Type()
+        type_.default = fomod.OptionType.REQUIRED
+        self.option.type = type_
+        expected = textwrap.dedent(
+            """\
+                <plugin name="boo">
+                  <description></description>
+                  <typeDescriptor>
+                    <dependencyType>
+                      <defaultType name="Required"/>
+                      <patterns>
+                      </patterns>
+                    </dependencyType>
+                  </typeDescriptor>
+                </plugin>"""
+        )
+        assert self.option.to_string() == expected
+
     def test_validate(self):
         expected = [
             warnings.ValidationWarning(
@@ -306,6 +306,10 @@ class TestInstaller(object):
             test_installer.next(
                 [installer.InstallerOption(test_installer, test_group[0])]
             )
+        with pytest.raises(ValueError):
+            test_installer.next(
+                [installer.InstallerOption(test_installer, fomod.Option())]
+            )
         test_root.pages.append(fomod.Page())
         test_root.pages[1].conditions["flag"] = "other"
         test_root.pages.append(fomod.Page())
@@ -425,7 +429,9 @@ class TestInstaller(object):
         installer_mock._test_file_condition.assert_called_once_with(
             "file", fomod.FileType.MISSING
         )
-        installer_mock._test_flag_condition.assert_called_once_with("flag", "value")
+        installer_mock._test_flag_condition.assert_called_once_with(
+            "flag", "value", installer_mock.flags.return_value
+        )
         installer_mock._test_version_condition.assert_called_once_with("version")
         installer_mock._test_conditions.assert_called_once()
         installer_mock._raise_failed_conditions.assert_not_called()
@@ -442,6 +448,11 @@ class TestInstaller(object):
         installer_mock._test_conditions.side_effect = installer._FailedCondition
         installer.Installer._test_conditions(installer_mock, test_conditions)
         installer_mock._raise_failed_conditions.assert_called_once()
+        installer_mock.reset_mock()
+        test_conditions = fomod.Conditions()
+        test_conditions["file"] = fomod.FileType.MISSING
+        installer.Installer._test_conditions(installer_mock, test_conditions)
+        installer_mock.flags.assert_not_called()
 
     def test_order_list(self):
         mock1 = Mock(spec=["name"])
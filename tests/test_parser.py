@@ -1,6 +1,10 @@
 import textwrap
+import threading
 from pathlib import Path
 
+import pytest
+from lxml import etree
+
 from pyfomod import ValidationWarning, parser
 
 PACKAGE_PATH = Path(__file__).parent / "package_test"
@@ -25,6 +29,94 @@ def test_preserve_data(tmp_path):
     assert orig_conf == new_conf
 
 
+def test_get_schema_per_thread():
+    schemas = []
+    thread = threading.Thread(target=lambda: schemas.append(parser._get_schema()))
+    thread.start()
+    thread.join()
+    assert parser._get_schema() is parser._get_schema()
+    assert schemas[0] is not parser._get_schema()
+
+
+def test_parse_lineno():
+    root = parser.parse(str(PACKAGE_PATH), lineno=True)
+    plain_root = parser.parse(str(PACKAGE_PATH))
+    assert root.to_string() == plain_root.to_string()
+    assert root._info.to_string() == plain_root._info.to_string()
+    assert root.lineno == 1
+    assert root.pages.lineno == 10
+    assert plain_root.lineno is None
+
+
+def test_parse_lineno_large(tmp_path):
+    # big enough that iterparse reports events before all text is read
+    option = (
+        '<plugin name="option{0}">'
+        "<description>A long enough description for option {0}.</description>"
+        '<typeDescriptor><type name="Optional"/></typeDescriptor>'
+        "</plugin>"
+    )
+    options = "".join(option.format(index) for index in range(3000))
+    (tmp_path / "fomod").mkdir()
+    conf_path = tmp_path / "fomod" / "moduleconfig.xml"
+    conf_path.write_text(
+        "<config><moduleName>Name</moduleName>"
+        '<installSteps order="Explicit"><installStep name="Step">'
+        '<optionalFileGroups order="Explicit">'
+        '<group name="Group" type="SelectAny"><plugins order="Explicit">'
+        "{}</plugins></group></optionalFileGroups></installStep></installSteps>"
+        "</config>".format(options)
+    )
+    root = parser.parse(str(tmp_path), lineno=True)
+    plain_root = parser.parse(str(tmp_path))
+    assert root.to_string() == plain_root.to_string()
+
+
+def test_parse_comment_split_text(tmp_path):
+    (tmp_path / "fomod").mkdir()
+    conf_path = tmp_path / "fomod" / "moduleconfig.xml"
+    conf_path.write_text(
+        "<config><moduleName><!-- todo -->My Mod</moduleName></config>"
+    )
+    assert parser.parse(str(tmp_path)).name == "My Mod"
+    assert parser.parse(str(tmp_path), warnings=[]).name == "My Mod"
+    assert parser.parse(str(tmp_path), lineno=True).name == "My Mod"
+
+
+def test_parse_pi_split_text(tmp_path):
+    (tmp_path / "fomod").mkdir()
+    conf_path = tmp_path / "fomod" / "moduleconfig.xml"
+    conf_path.write_text("<config><moduleName>My<?pi x?>Mod</moduleName></config>")
+    assert parser.parse(str(tmp_path)).name == "MyMod"
+    assert parser.parse(str(tmp_path), warnings=[]).name == "MyMod"
+    assert parser.parse(str(tmp_path), lineno=True).name == "MyMod"
+
+
+def test_parse_warnings_lineno(tmp_path):
+    (tmp_path / "fomod").mkdir()
+    conf_path = tmp_path / "fomod" / "moduleconfig.xml"
+    conf_path.write_text("<config><!-- c --><moduleName>x</moduleName></config>")
+    warnings = []
+    parser.parse((None, str(conf_path)), warnings=warnings)
+    lineno_warnings = []
+    parser.parse((None, str(conf_path)), warnings=lineno_warnings, lineno=True)
+    assert warnings == lineno_warnings
+    assert warnings[0].title == "XML Comments Present"
+
+
+def test_parse_syntax_error(tmp_path):
+    (tmp_path / "fomod").mkdir()
+    conf_path = tmp_path / "fomod" / "moduleconfig.xml"
+    conf_path.write_text("<config><moduleName>x</moduleName><oops></config>")
+    for lineno in (False, True):
+        warnings = []
+        with pytest.raises(etree.XMLSyntaxError):
+            parser.parse((None, str(conf_path)), warnings=warnings, lineno=lineno)
+        assert len(warnings) == 1
+        assert warnings[0].title == "XML Syntax Error"
+        assert warnings[0].msg.startswith("Opening and ending tag mismatch")
+
+
 def test_parse(tmp_path):
     root = parser.parse(str(PACKAGE_PATH))
     tuple_root = parser.parse((str(INFO_PATH), str(CONF_PATH)))